@@ -0,0 +1,83 @@
+"""
+Benchmark overlap-add FIR filtering against direct convolution with np.convolve,
+and IIR filtering with second-order sections.
+
+Run from the project root:
+    python benchmarks/bench_filter.py
+"""
+import importlib.util
+import timeit
+
+import numpy as np
+
+from syntdatafft.filter import design_fir, design_iir, overlap_add_convolve, sos_filter
+
+
+def bench(signal_length: int, numtaps: int, repeat: int = 3) -> None:
+    """
+    Time overlap_add_convolve and np.convolve on random data and print the result.
+
+    Parameters:
+    - signal_length (int): Number of samples in the signal.
+    - numtaps (int): Number of FIR filter taps.
+    - repeat (int): Number of timing runs, the fastest run is reported.
+
+    Returns:
+    None
+    """
+    data = np.random.default_rng(0).normal(size=signal_length)
+    taps = design_fir(numtaps, 10.0, 100.0)
+
+    assert np.allclose(overlap_add_convolve(data, taps), np.convolve(data, taps))
+
+    direct = min(timeit.repeat(lambda: np.convolve(data, taps), number=1, repeat=repeat))
+    overlap_add = min(
+        timeit.repeat(lambda: overlap_add_convolve(data, taps), number=1, repeat=repeat)
+    )
+    print(
+        f"{signal_length:>10} {numtaps:>6} {direct * 1e3:>12.2f} {overlap_add * 1e3:>12.2f}"
+        f" {direct / overlap_add:>8.1f}x"
+    )
+
+
+def bench_iir(signal_length: int, order: int, repeat: int = 3) -> None:
+    """
+    Time sos_filter with a Butterworth lowpass filter on random data and print the result.
+
+    Parameters:
+    - signal_length (int): Number of samples in the signal.
+    - order (int): Butterworth filter order.
+    - repeat (int): Number of timing runs, the fastest run is reported.
+
+    Returns:
+    None
+    """
+    data = np.random.default_rng(0).normal(size=signal_length)
+    sos = design_iir(order, 10.0, 100.0)
+
+    elapsed = min(timeit.repeat(lambda: sos_filter(sos, data), number=1, repeat=repeat))
+    print(f"{signal_length:>10} {order:>6} {elapsed * 1e3:>12.2f}")
+
+
+def main():
+    """
+    Run the benchmark over a grid of signal lengths and tap counts.
+
+    Returns:
+    None
+    """
+    print(f"{'samples':>10} {'taps':>6} {'convolve ms':>12} {'ola ms':>12} {'speedup':>9}")
+    for signal_length in (10_000, 100_000, 1_000_000):
+        for numtaps in (31, 255, 1023, 4095):
+            bench(signal_length, numtaps)
+
+    backend = "scipy" if importlib.util.find_spec("scipy") else "numpy"
+    print(f"\nIIR sos_filter ({backend} backend)")
+    print(f"{'samples':>10} {'order':>6} {'sos_filter ms':>12}")
+    for signal_length in (10_000, 100_000, 1_000_000):
+        for order in (2, 4, 8):
+            bench_iir(signal_length, order)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,15 @@
 from .data import gen_1d_test_data
 from .fft import workflow_fft
+from .filter import (
+    workflow_filter,
+    design_fir,
+    design_iir,
+    sos_filter,
+    overlap_add_convolve,
+    fir_filter,
+    fir_filter_block,
+)
 from .gui import make_layout, make_window, open_about_window, open_contact_window
 from .plot import define_plot, update_plot
-from .utils import change_type_to_float, are_all_floats, generate_anomalies, create_plot_dict
+from .utils import change_type_to_float, are_all_floats, generate_anomalies, create_plot_dict, create_filter_dict, create_filter_kwargs
 from .run_app import run_app
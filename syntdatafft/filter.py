@@ -0,0 +1,419 @@
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+
+try:
+    from scipy.signal import sosfilt as _scipy_sosfilt
+except ImportError:
+    _scipy_sosfilt = None
+
+Cutoff = Union[float, Sequence[float]]
+
+# Below this number of taps, direct convolution with np.convolve is faster than
+# overlap-add (see benchmarks/bench_filter.py)
+DIRECT_CONVOLVE_MAX_TAPS = 64
+
+
+def workflow_filter(
+    data: np.ndarray,
+    sampling_rate: Union[int, float],
+    cutoff: Cutoff,
+    btype: str = "lowpass",
+    method: str = "fir",
+    numtaps: int = 101,
+    order: int = 4,
+) -> np.ndarray:
+    """
+    Filter the input data before it is passed on to the FFT workflow.
+
+    The workflow includes:
+    1. Designing a FIR (windowed-sinc) or IIR (Butterworth) filter.
+    2. Applying a FIR filter by overlap-add fast convolution (direct convolution for
+       fewer than DIRECT_CONVOLVE_MAX_TAPS taps), or an IIR filter as a cascade of
+       second-order sections.
+
+    Parameters:
+    - data (numpy.ndarray): Input time-domain data.
+    - sampling_rate (Union[int, float]): Sampling rate of the input data.
+    - cutoff (float or sequence of two floats): Cutoff frequency in Hertz. A pair of
+      frequencies (low, high) is required when btype is "bandpass".
+    - btype (str): Filter type, one of "lowpass", "highpass" or "bandpass".
+    - method (str): Filter method, either "fir" or "iir".
+    - numtaps (int): Number of FIR filter taps, must be odd. Only used when method is "fir".
+    - order (int): Butterworth filter order. Only used when method is "iir".
+
+    Returns:
+    - data_filtered (numpy.ndarray): Filtered data, same length as the input data.
+
+    Note:
+    - The FIR output is compensated for the (numtaps - 1) / 2 sample group delay of
+      the linear-phase filter, so it stays aligned with the time array of the input.
+      An odd number of taps is required for this delay to be a whole number of samples.
+    - The IIR output is causal and keeps the phase delay of the Butterworth filter.
+
+    Example:
+    >>> workflow_filter(np.ones(5), 100.0, 10.0, numtaps=3)
+    array([0.93490427, 1.        , 1.        , 1.        , 0.93490427])
+    """
+    if method == "fir":
+        if numtaps % 2 == 0:
+            raise ValueError("FIR filtering requires an odd number of taps")
+        taps = design_fir(numtaps, cutoff, sampling_rate, btype)
+        if numtaps < DIRECT_CONVOLVE_MAX_TAPS:
+            convolved = np.convolve(np.asarray(data, dtype=float), taps)
+        else:
+            convolved = overlap_add_convolve(data, taps)
+        delay = (numtaps - 1) // 2
+        return convolved[delay : delay + len(data)]
+    if method == "iir":
+        sos = design_iir(order, cutoff, sampling_rate, btype)
+        data_filtered, _ = sos_filter(sos, data)
+        return data_filtered
+    raise ValueError(f"Unknown filter method '{method}', expected 'fir' or 'iir'")
+
+
+def _normalized_cutoff(
+    cutoff: Cutoff, sampling_rate: Union[int, float], btype: str
+) -> np.ndarray:
+    """
+    Validate the cutoff frequencies and normalize them to the Nyquist frequency.
+
+    Parameters:
+    - cutoff (float or sequence of two floats): Cutoff frequency in Hertz.
+    - sampling_rate (Union[int, float]): Sampling rate of the data.
+    - btype (str): Filter type, one of "lowpass", "highpass" or "bandpass".
+
+    Returns:
+    - normalized (numpy.ndarray): Cutoff frequencies divided by the Nyquist frequency.
+    """
+    cutoff = np.atleast_1d(np.asarray(cutoff, dtype=float))
+    expected = 2 if btype == "bandpass" else 1
+    if btype not in ("lowpass", "highpass", "bandpass"):
+        raise ValueError(
+            f"Unknown filter type '{btype}', expected 'lowpass', 'highpass' or 'bandpass'"
+        )
+    if cutoff.size != expected:
+        raise ValueError(f"Filter type '{btype}' requires {expected} cutoff frequency(s)")
+
+    normalized = cutoff / (sampling_rate / 2)
+    if np.any(normalized <= 0) or np.any(normalized >= 1):
+        raise ValueError("Cutoff frequencies must lie between 0 and the Nyquist frequency")
+    if expected == 2 and normalized[0] >= normalized[1]:
+        raise ValueError("Bandpass cutoff frequencies must be given as (low, high)")
+    return normalized
+
+
+def design_fir(
+    numtaps: int,
+    cutoff: Cutoff,
+    sampling_rate: Union[int, float],
+    btype: str = "lowpass",
+) -> np.ndarray:
+    """
+    Design a linear-phase FIR filter using the Hamming-windowed sinc method.
+
+    Parameters:
+    - numtaps (int): Number of filter taps. Must be odd for "highpass".
+    - cutoff (float or sequence of two floats): Cutoff frequency in Hertz.
+    - sampling_rate (Union[int, float]): Sampling rate of the data.
+    - btype (str): Filter type, one of "lowpass", "highpass" or "bandpass".
+
+    Returns:
+    - taps (numpy.ndarray): FIR filter coefficients.
+
+    Example:
+    >>> taps = design_fir(5, 10.0, 100.0)
+    >>> float(taps.sum())
+    1.0
+    """
+    normalized = _normalized_cutoff(cutoff, sampling_rate, btype)
+    if numtaps < 1:
+        raise ValueError("Number of taps must be at least 1")
+    if btype == "highpass" and numtaps % 2 == 0:
+        raise ValueError("A highpass FIR filter requires an odd number of taps")
+
+    n = np.arange(numtaps) - (numtaps - 1) / 2
+    window = np.hamming(numtaps)
+
+    def lowpass(fc: float) -> np.ndarray:
+        taps = fc * np.sinc(fc * n) * window
+        return taps / taps.sum()
+
+    if btype == "lowpass":
+        return lowpass(normalized[0])
+
+    if btype == "highpass":
+        # Spectral inversion of the lowpass filter
+        taps = -lowpass(normalized[0])
+        taps[(numtaps - 1) // 2] += 1.0
+        return taps
+
+    taps = (normalized[1] * np.sinc(normalized[1] * n)
+            - normalized[0] * np.sinc(normalized[0] * n)) * window
+    # Scale to unity gain at the center of the passband
+    center = np.pi * (normalized[0] + normalized[1]) / 2
+    return taps / np.abs(np.sum(taps * np.exp(-1j * center * n)))
+
+
+def design_iir(
+    order: int,
+    cutoff: Cutoff,
+    sampling_rate: Union[int, float],
+    btype: str = "lowpass",
+) -> np.ndarray:
+    """
+    Design a digital Butterworth filter as second-order sections.
+
+    The analog Butterworth prototype is mapped to the digital domain using the
+    bilinear transform with frequency prewarping. A bandpass filter is built as a
+    highpass at the lower cutoff cascaded with a lowpass at the upper cutoff.
+
+    Parameters:
+    - order (int): Filter order (per edge for "bandpass").
+    - cutoff (float or sequence of two floats): Cutoff frequency in Hertz.
+    - sampling_rate (Union[int, float]): Sampling rate of the data.
+    - btype (str): Filter type, one of "lowpass", "highpass" or "bandpass".
+
+    Returns:
+    - sos (numpy.ndarray): Array of shape (n_sections, 6) where each row holds
+      [b0, b1, b2, 1, a1, a2] of one second-order section.
+
+    Example:
+    >>> design_iir(2, 10.0, 100.0)
+    array([[ 0.06745527,  0.13491055,  0.06745527,  1.        , -1.1429805 ,
+             0.4128016 ]])
+    """
+    normalized = _normalized_cutoff(cutoff, sampling_rate, btype)
+    if order < 1:
+        raise ValueError("Filter order must be at least 1")
+
+    if btype == "bandpass":
+        return np.vstack(
+            [
+                _butter_sos(order, normalized[0], highpass=True),
+                _butter_sos(order, normalized[1], highpass=False),
+            ]
+        )
+    return _butter_sos(order, normalized[0], highpass=btype == "highpass")
+
+
+def _butter_sos(order: int, normalized_cutoff: float, highpass: bool) -> np.ndarray:
+    """
+    Build the second-order sections of a lowpass or highpass Butterworth filter.
+
+    Parameters:
+    - order (int): Filter order.
+    - normalized_cutoff (float): Cutoff frequency divided by the Nyquist frequency.
+    - highpass (bool): True for a highpass filter, False for a lowpass filter.
+
+    Returns:
+    - sos (numpy.ndarray): Array of shape (n_sections, 6), unity gain in the passband.
+    """
+    # Prewarped analog cutoff for a sampling rate of 2 (Nyquist frequency of 1)
+    warped = 4 * np.tan(np.pi * normalized_cutoff / 2)
+    k = np.arange(order)
+    prototype = np.exp(1j * np.pi * (2 * k + order + 1) / (2 * order))
+    analog_poles = warped / prototype if highpass else warped * prototype
+    poles = (4 + analog_poles) / (4 - analog_poles)
+
+    zero = 1.0 if highpass else -1.0
+    sections = []
+    for pole in poles[poles.imag > 1e-12]:
+        a = np.array([1.0, -2 * pole.real, abs(pole) ** 2])
+        b = np.array([1.0, -2 * zero, 1.0])
+        sections.append(_unity_gain_section(b, a, zero))
+    for pole in poles[np.abs(poles.imag) <= 1e-12]:
+        a = np.array([1.0, -pole.real, 0.0])
+        b = np.array([1.0, -zero, 0.0])
+        sections.append(_unity_gain_section(b, a, zero))
+    return np.array(sections)
+
+
+def _unity_gain_section(b: np.ndarray, a: np.ndarray, zero: float) -> np.ndarray:
+    """
+    Scale a section to unity gain at the point on the unit circle opposite its zero.
+
+    Parameters:
+    - b (numpy.ndarray): Numerator coefficients [b0, b1, b2].
+    - a (numpy.ndarray): Denominator coefficients [1, a1, a2].
+    - zero (float): Location of the section zeros, -1 (lowpass) or 1 (highpass).
+
+    Returns:
+    - section (numpy.ndarray): Scaled section [b0, b1, b2, 1, a1, a2].
+    """
+    z = -zero
+    gain = np.polyval(a[::-1], 1 / z) / np.polyval(b[::-1], 1 / z)
+    return np.concatenate([b * gain, a])
+
+
+def sos_filter(
+    sos: np.ndarray, data: np.ndarray, zi: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Filter the input data with a cascade of second-order sections.
+
+    Each section is evaluated in transposed direct form II, using scipy.signal.sosfilt
+    when SciPy is installed and a pure numpy fallback otherwise. Passing the returned
+    final state as zi for the next call filters a signal block by block with the
+    same result as filtering it in one go.
+
+    Parameters:
+    - sos (numpy.ndarray): Array of shape (n_sections, 6), as returned by design_iir.
+    - data (numpy.ndarray): Input time-domain data.
+    - zi (numpy.ndarray, optional): Initial state of shape (n_sections, 2). Zeros if None.
+
+    Returns:
+    - data_filtered (numpy.ndarray): Filtered data, same length as the input data.
+    - zf (numpy.ndarray): Final state of shape (n_sections, 2).
+
+    Example:
+    >>> sos = design_iir(2, 10.0, 100.0)
+    >>> sos_filter(sos, np.array([1.0, 0.0, 0.0]))
+    (array([0.06745527, 0.21201061, 0.28193362]), array([[ 0.23472632, -0.11638265]]))
+    """
+    sos = np.atleast_2d(np.asarray(sos, dtype=float))
+    data = np.asarray(data, dtype=float)
+    if data.ndim != 1:
+        raise ValueError("Input data must be a 1D array")
+    if sos.ndim != 2 or sos.shape[1] != 6:
+        raise ValueError("Second-order sections must be an array of shape (n_sections, 6)")
+    zf = np.zeros((len(sos), 2)) if zi is None else np.array(zi, dtype=float)
+    if zf.shape != (len(sos), 2):
+        raise ValueError(f"Initial state must be an array of shape ({len(sos)}, 2)")
+
+    if _scipy_sosfilt is not None:
+        return _scipy_sosfilt(sos, data, zi=zf)
+
+    y = data.tolist()
+
+    for i, (b0, b1, b2, _, a1, a2) in enumerate(sos.tolist()):
+        z0, z1 = zf[i]
+        for n, x in enumerate(y):
+            out = b0 * x + z0
+            z0 = b1 * x - a1 * out + z1
+            z1 = b2 * x - a2 * out
+            y[n] = out
+        zf[i] = z0, z1
+
+    return np.array(y), zf
+
+
+def _next_fast_len(n: int) -> int:
+    """
+    Return the smallest power of two greater than or equal to n.
+
+    Parameters:
+    - n (int): Minimum length.
+
+    Returns:
+    - length (int): Power of two FFT length.
+    """
+    return 1 << max(n - 1, 0).bit_length()
+
+
+def overlap_add_convolve(
+    data: np.ndarray, taps: np.ndarray, block_size: Optional[int] = None
+) -> np.ndarray:
+    """
+    Convolve the input data with FIR taps using FFT-based overlap-add.
+
+    The data is split into blocks of block_size samples. Each block is convolved
+    with the taps in the frequency domain, and the overlapping tails of adjacent
+    blocks are added together. The result equals np.convolve(data, taps).
+
+    Parameters:
+    - data (numpy.ndarray): Input time-domain data.
+    - taps (numpy.ndarray): FIR filter coefficients.
+    - block_size (int, optional): Number of input samples per block. If None, a block
+      size is chosen so that the FFT length is a power of two about eight times the
+      number of taps.
+
+    Returns:
+    - convolved (numpy.ndarray): Full convolution of length len(data) + len(taps) - 1.
+
+    Example:
+    >>> overlap_add_convolve(np.array([1.0, 2.0, 3.0]), np.array([0.5, 0.5]))
+    array([0.5, 1.5, 2.5, 1.5])
+    """
+    data = np.asarray(data, dtype=float)
+    taps = np.asarray(taps, dtype=float)
+    if data.ndim != 1:
+        raise ValueError("Input data must be a 1D array")
+    if taps.ndim != 1:
+        raise ValueError("FIR taps must be a 1D array")
+    n_data, n_taps = len(data), len(taps)
+    if n_data == 0 or n_taps == 0:
+        return np.zeros(max(n_data + n_taps - 1, 0))
+
+    if block_size is None:
+        nfft = _next_fast_len(8 * n_taps)
+        block_size = nfft - n_taps + 1
+    elif block_size < 1:
+        raise ValueError("Block size must be at least 1")
+    block_size = min(block_size, n_data)
+    nfft = _next_fast_len(block_size + n_taps - 1)
+
+    n_blocks = -(-n_data // block_size)
+    blocks = np.zeros((n_blocks, block_size))
+    blocks.flat[:n_data] = data
+
+    taps_fft = np.fft.rfft(taps, nfft)
+    blocks_conv = np.fft.irfft(np.fft.rfft(blocks, nfft, axis=1) * taps_fft, nfft, axis=1)
+
+    convolved = np.zeros(n_blocks * block_size + nfft)
+    for i, block_conv in enumerate(blocks_conv):
+        start = i * block_size
+        convolved[start : start + nfft] += block_conv
+    return convolved[: n_data + n_taps - 1]
+
+
+def fir_filter(
+    data: np.ndarray, taps: np.ndarray, block_size: Optional[int] = None
+) -> np.ndarray:
+    """
+    Apply FIR taps to the input data using overlap-add fast convolution.
+
+    Parameters:
+    - data (numpy.ndarray): Input time-domain data.
+    - taps (numpy.ndarray): FIR filter coefficients.
+    - block_size (int, optional): Number of input samples per block, see overlap_add_convolve.
+
+    Returns:
+    - data_filtered (numpy.ndarray): Causally filtered data, same length as the input data.
+
+    Example:
+    >>> fir_filter(np.array([1.0, 2.0, 3.0]), np.array([0.5, 0.5]))
+    array([0.5, 1.5, 2.5])
+    """
+    return overlap_add_convolve(data, taps, block_size)[: len(data)]
+
+
+def fir_filter_block(
+    block: np.ndarray, taps: np.ndarray, tail: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apply FIR taps to one block of a longer signal processed in chunks.
+
+    Passing the returned tail as tail for the next block filters a signal block by
+    block with the same result as fir_filter applied to the whole signal.
+
+    Parameters:
+    - block (numpy.ndarray): Current block of input data.
+    - taps (numpy.ndarray): FIR filter coefficients.
+    - tail (numpy.ndarray, optional): Convolution tail of length len(taps) - 1 carried
+      over from the previous block. Zeros if None.
+
+    Returns:
+    - block_filtered (numpy.ndarray): Filtered block, same length as the input block.
+    - tail (numpy.ndarray): Convolution tail to pass on to the next block.
+
+    Example:
+    >>> taps = np.array([0.5, 0.5])
+    >>> out, tail = fir_filter_block(np.array([1.0, 2.0]), taps)
+    >>> fir_filter_block(np.array([3.0]), taps, tail)
+    (array([2.5]), array([1.5]))
+    """
+    n_block = len(block)
+    convolved = overlap_add_convolve(block, taps)
+    if tail is not None:
+        convolved[: len(tail)] += tail
+    return convolved[:n_block], convolved[n_block:]
@@ -49,6 +49,29 @@ def make_layout():
             sg.InputText(key=f"input_2_4", default_text="10", size=pad),
             sg.InputText(key=f"input_2_5", default_text="0.8", size=pad),
         ],
+        [
+            sg.Text("", size=text_pad),
+            *[
+                sg.Text(label, size=pad1)
+                for label in [
+                    "Method",
+                    "Type",
+                    "Low cutoff (Hz)",
+                    "High cutoff (Hz)",
+                    "FIR taps",
+                    "IIR order",
+                ]
+            ],
+        ],
+        [
+            sg.Text("Filter:", size=text_pad),
+            sg.Combo(["None", "FIR", "IIR"], default_value="None", key="filter_method", size=pad1, readonly=True),
+            sg.Combo(["lowpass", "highpass", "bandpass"], default_value="lowpass", key="filter_type", size=pad1, readonly=True),
+            sg.InputText(key="filter_low_cutoff", default_text="2", size=pad),
+            sg.InputText(key="filter_high_cutoff", default_text="8", size=pad),
+            sg.InputText(key="filter_numtaps", default_text="101", size=pad),
+            sg.InputText(key="filter_order", default_text="4", size=pad),
+        ],
         [sg.Button("Update plot")],
         [sg.Canvas(key="-CANVAS-")],
     ]
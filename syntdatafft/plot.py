@@ -16,7 +16,9 @@ def define_plot(window):
     return fig, ax, canvas
 
 
-def update_plot(fig, ax, time, data, data_windowed, window, freq, magnitude_db):
+def update_plot(
+    fig, ax, time, data, data_windowed, window, freq, magnitude_db, data_filtered=None
+):
     for subplot in ax:
         subplot.clear()
 
@@ -24,7 +26,10 @@ def update_plot(fig, ax, time, data, data_windowed, window, freq, magnitude_db):
         update_plot.ax1.clear()
 
     ax[0].set_title("Raw signal")
-    ax[0].plot(time, data, "k", linewidth=1)
+    ax[0].plot(time, data, "k", label="Raw signal", linewidth=1)
+    if data_filtered is not None:
+        ax[0].plot(time, data_filtered, "b", label="Filtered signal", linewidth=1)
+        ax[0].legend(loc="upper right")
     ax[0].set_xlabel("Duration (s)")
     ax[0].set_ylabel("Amplitude")
     ax[0].grid(alpha=0.6)
@@ -31,6 +31,8 @@ def run_app():
             sdf.open_contact_window()
 
         if event == "Update plot":
+            filter_settings, filter_params = sdf.create_filter_dict(values)
+
             plot_dict = sdf.create_plot_dict(values)
             plot_dict = sdf.change_type_to_float(plot_dict)
 
@@ -45,12 +47,33 @@ def run_app():
                     duration, sampling_rate, noise_level, anomalies
                 )
 
+                data_filtered = None
+                if filter_settings["method"] != "None":
+                    try:
+                        filter_kwargs = sdf.create_filter_kwargs(
+                            filter_settings, filter_params
+                        )
+                        data_filtered = sdf.workflow_filter(
+                            data, sampling_rate, **filter_kwargs
+                        )
+                    except ValueError as error:
+                        sg.popup(f"Invalid filter parameters: {error}")
+                        continue
+
                 data_windowed, data_window, freq, magnitude_db = sdf.workflow_fft(
-                    data, sampling_rate
+                    data if data_filtered is None else data_filtered, sampling_rate
                 )
 
                 sdf.update_plot(
-                    fig, ax, time, data, data_windowed, data_window, freq, magnitude_db
+                    fig,
+                    ax,
+                    time,
+                    data,
+                    data_windowed,
+                    data_window,
+                    freq,
+                    magnitude_db,
+                    data_filtered,
                 )
                 canvas.draw()
     window.close()
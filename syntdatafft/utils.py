@@ -1,4 +1,5 @@
-from typing import Dict, List, Union, Any
+import math
+from typing import Dict, List, Union, Any, Tuple
 
 
 def change_type_to_float(values: Dict[str, Any]) -> Dict[str, Any]:
@@ -99,6 +100,111 @@ def create_plot_dict(values: Dict[str, float]) -> Dict[str, float]:
     return plot_dict
 
 
+def create_filter_dict(
+    values: Dict[str, Any]
+) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Remove the filter parameters from the GUI values and split them into filter settings
+    and numeric filter parameters.
+
+    Parameters:
+    - values (dict): A dictionary containing the GUI values. The filter keys are removed from it.
+
+    Returns:
+    - filter_settings (dict): Filter method and filter type, with keys "method" and "btype".
+    - filter_params (dict): Numeric filter parameters, with keys "low_cutoff", "high_cutoff",
+      "numtaps" and "order".
+
+    Example:
+    >>> values = {
+    ...     "duration": "200",
+    ...     "filter_method": "FIR",
+    ...     "filter_type": "lowpass",
+    ...     "filter_low_cutoff": "2",
+    ...     "filter_high_cutoff": "8",
+    ...     "filter_numtaps": "101",
+    ...     "filter_order": "4",
+    ... }
+    >>> create_filter_dict(values)
+    ({'method': 'FIR', 'btype': 'lowpass'},
+     {'low_cutoff': '2', 'high_cutoff': '8', 'numtaps': '101', 'order': '4'})
+    >>> values
+    {'duration': '200'}
+    """
+    filter_settings = {
+        "method": values.pop("filter_method"),
+        "btype": values.pop("filter_type"),
+    }
+    filter_params = {
+        "low_cutoff": values.pop("filter_low_cutoff"),
+        "high_cutoff": values.pop("filter_high_cutoff"),
+        "numtaps": values.pop("filter_numtaps"),
+        "order": values.pop("filter_order"),
+    }
+    return filter_settings, filter_params
+
+
+def create_filter_kwargs(
+    filter_settings: Dict[str, str], filter_params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Convert the filter settings and parameters from the GUI into keyword arguments for workflow_filter.
+
+    Only the parameters used by the selected filter are converted and checked: the cutoff
+    frequency (or frequencies) of the filter type, and the number of taps for FIR or the
+    filter order for IIR.
+
+    Parameters:
+    - filter_settings (dict): Filter method and filter type, as returned by create_filter_dict.
+    - filter_params (dict): Filter parameters, as returned by create_filter_dict.
+
+    Returns:
+    - filter_kwargs (dict): Keyword arguments "cutoff", "btype", "method" and either
+      "numtaps" or "order".
+
+    Raises:
+    - ValueError: If a used parameter is not a finite number, or if the number of taps or
+      the filter order is not a whole number.
+
+    Example:
+    >>> filter_settings = {"method": "FIR", "btype": "bandpass"}
+    >>> filter_params = {"low_cutoff": "2", "high_cutoff": "8", "numtaps": "101", "order": ""}
+    >>> create_filter_kwargs(filter_settings, filter_params)
+    {'cutoff': (2.0, 8.0), 'btype': 'bandpass', 'method': 'fir', 'numtaps': 101}
+    """
+    method = filter_settings["method"].lower()
+    btype = filter_settings["btype"]
+
+    if btype == "lowpass":
+        cutoff_keys = ["high_cutoff"]
+    elif btype == "highpass":
+        cutoff_keys = ["low_cutoff"]
+    else:
+        cutoff_keys = ["low_cutoff", "high_cutoff"]
+    size_key = "numtaps" if method == "fir" else "order"
+
+    params = change_type_to_float(
+        {key: filter_params[key] for key in cutoff_keys + [size_key]}
+    )
+    for key, value in params.items():
+        if not isinstance(value, float) or not math.isfinite(value):
+            raise ValueError(f"'{key}' must be a finite number, got '{value}'")
+    if not params[size_key].is_integer():
+        raise ValueError(f"'{size_key}' must be a whole number, got '{params[size_key]}'")
+
+    if len(cutoff_keys) == 1:
+        cutoff = params[cutoff_keys[0]]
+    else:
+        cutoff = tuple(params[key] for key in cutoff_keys)
+
+    return {
+        "cutoff": cutoff,
+        "btype": btype,
+        "method": method,
+        size_key: int(params[size_key]),
+    }
+
+
 def generate_anomalies(
     plot_dict: Dict[str, Union[float, int]]
 ) -> List[Dict[str, Union[float, int]]]:
@@ -0,0 +1,202 @@
+from syntdatafft import (
+    design_fir,
+    design_iir,
+    sos_filter,
+    overlap_add_convolve,
+    fir_filter,
+    fir_filter_block,
+    workflow_filter,
+)
+import syntdatafft.filter as filter_module
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def example_data():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=2000)
+
+
+def frequency_response(taps, frequency, sampling_rate):
+    n = np.arange(len(taps))
+    return np.abs(np.sum(taps * np.exp(-2j * np.pi * frequency / sampling_rate * n)))
+
+
+def sos_frequency_response(sos, frequency, sampling_rate):
+    z_inv = np.exp(-2j * np.pi * frequency / sampling_rate)
+    response = 1.0
+    for b0, b1, b2, _, a1, a2 in sos:
+        response *= (b0 + b1 * z_inv + b2 * z_inv**2) / (1 + a1 * z_inv + a2 * z_inv**2)
+    return np.abs(response)
+
+
+@pytest.mark.parametrize("block_size", [None, 1, 7, 500, 5000])
+def test_overlap_add_convolve(example_data, block_size):
+    taps = np.random.default_rng(1).normal(size=63)
+
+    result = overlap_add_convolve(example_data, taps, block_size)
+
+    assert np.allclose(result, np.convolve(example_data, taps))
+
+
+def test_overlap_add_convolve_short_data():
+    data = np.array([1.0, 2.0, 3.0])
+    taps = np.arange(10, dtype=float)
+
+    assert np.allclose(overlap_add_convolve(data, taps), np.convolve(data, taps))
+
+
+def test_fir_filter(example_data):
+    taps = design_fir(101, 10.0, 100.0)
+
+    result = fir_filter(example_data, taps)
+
+    assert len(result) == len(example_data)
+    assert np.allclose(result, np.convolve(example_data, taps)[: len(example_data)])
+
+
+def test_fir_filter_block(example_data):
+    taps = design_fir(101, [5.0, 15.0], 100.0, btype="bandpass")
+
+    # Uneven chunks, including chunks shorter than the filter
+    chunks = np.array_split(example_data, [3, 50, 51, 1200])
+    tail = None
+    result = []
+    for chunk in chunks:
+        chunk_filtered, tail = fir_filter_block(chunk, taps, tail)
+        result.append(chunk_filtered)
+
+    assert np.allclose(np.concatenate(result), fir_filter(example_data, taps))
+
+
+@pytest.mark.parametrize(
+    "btype, cutoff, passband, stopband",
+    [
+        ("lowpass", 10.0, 1.0, 30.0),
+        ("highpass", 10.0, 30.0, 1.0),
+        ("bandpass", [5.0, 20.0], 10.0, 40.0),
+    ],
+)
+def test_design_fir(btype, cutoff, passband, stopband):
+    taps = design_fir(101, cutoff, 100.0, btype)
+
+    assert len(taps) == 101
+    assert np.allclose(taps, taps[::-1])
+    assert frequency_response(taps, passband, 100.0) == pytest.approx(1.0, abs=0.01)
+    assert frequency_response(taps, stopband, 100.0) < 0.01
+
+
+@pytest.mark.parametrize(
+    "btype, cutoff, passband, stopband",
+    [
+        ("lowpass", 10.0, 1.0, 40.0),
+        ("highpass", 10.0, 40.0, 1.0),
+        ("bandpass", [5.0, 20.0], 10.0, 45.0),
+    ],
+)
+def test_design_iir(btype, cutoff, passband, stopband):
+    sos = design_iir(4, cutoff, 100.0, btype)
+
+    assert sos.shape[1] == 6
+    assert np.allclose(sos[:, 3], 1.0)
+    assert sos_frequency_response(sos, passband, 100.0) == pytest.approx(1.0, abs=0.05)
+    assert sos_frequency_response(sos, stopband, 100.0) < 0.01
+
+    # Butterworth lowpass and highpass filters are -3 dB at the cutoff frequency
+    if btype != "bandpass":
+        assert sos_frequency_response(sos, cutoff, 100.0) == pytest.approx(
+            1 / np.sqrt(2)
+        )
+
+
+def test_sos_filter_state(example_data):
+    sos = design_iir(5, 10.0, 100.0)
+
+    result, _ = sos_filter(sos, example_data)
+    first, zf = sos_filter(sos, example_data[:777])
+    second, _ = sos_filter(sos, example_data[777:], zf)
+
+    assert np.allclose(result, np.concatenate([first, second]))
+
+
+def test_sos_filter_numpy_fallback(example_data, monkeypatch):
+    sos = design_iir(4, [5.0, 20.0], 100.0, btype="bandpass")
+    expected, expected_zf = sos_filter(sos, example_data)
+
+    monkeypatch.setattr(filter_module, "_scipy_sosfilt", None)
+    result, zf = sos_filter(sos, example_data)
+
+    assert np.allclose(result, expected)
+    assert np.allclose(zf, expected_zf)
+
+
+def test_sos_filter_impulse_response():
+    sos = design_iir(3, 10.0, 100.0)
+    impulse = np.zeros(500)
+    impulse[0] = 1.0
+
+    result, _ = sos_filter(sos, impulse)
+
+    # A stable lowpass filter decays and has unity gain at DC
+    assert abs(result[-1]) < 1e-10
+    assert result.sum() == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("method", ["fir", "iir"])
+def test_workflow_filter(example_data, method):
+    result = workflow_filter(example_data, 100.0, 10.0, method=method)
+
+    assert result.shape == example_data.shape
+    assert result.var() < example_data.var()
+
+
+def test_workflow_filter_fir_alignment():
+    sampling_rate = 100.0
+    time = np.arange(0, 10, 1 / sampling_rate)
+    data = np.sin(2 * np.pi * 3.0 * time)
+
+    result = workflow_filter(data, sampling_rate, 10.0, numtaps=101)
+
+    # Away from the edges, a passband sinusoid passes through without delay
+    assert np.allclose(result[100:-100], data[100:-100], atol=0.01)
+
+
+@pytest.mark.parametrize("numtaps", [31, 101])
+def test_workflow_filter_fir_convolution(example_data, numtaps):
+    # Short filters use direct convolution, long filters use overlap-add
+    taps = design_fir(numtaps, 10.0, 100.0)
+    delay = (numtaps - 1) // 2
+
+    result = workflow_filter(example_data, 100.0, 10.0, numtaps=numtaps)
+
+    expected = np.convolve(example_data, taps)[delay : delay + len(example_data)]
+    assert np.allclose(result, expected)
+
+
+def test_filter_invalid_dimensions():
+    with pytest.raises(ValueError):
+        fir_filter(np.ones((3, 4)), np.ones(3))
+    with pytest.raises(ValueError):
+        overlap_add_convolve(np.ones(10), np.ones((3, 1)))
+    with pytest.raises(ValueError):
+        sos_filter(design_iir(2, 10.0, 100.0), np.ones((3, 4)))
+    with pytest.raises(ValueError):
+        sos_filter(design_iir(4, 10.0, 100.0), np.ones(10), zi=np.zeros((1, 2)))
+
+
+def test_workflow_filter_invalid():
+    data = np.zeros(10)
+
+    with pytest.raises(ValueError):
+        workflow_filter(data, 100.0, 10.0, method="unknown")
+    with pytest.raises(ValueError):
+        workflow_filter(data, 100.0, 60.0)
+    with pytest.raises(ValueError):
+        workflow_filter(data, 100.0, 10.0, btype="bandpass")
+    with pytest.raises(ValueError):
+        workflow_filter(data, 100.0, [20.0, 10.0], btype="bandpass")
+    with pytest.raises(ValueError):
+        design_fir(100, 10.0, 100.0, btype="highpass")
+    with pytest.raises(ValueError):
+        workflow_filter(data, 100.0, 10.0, numtaps=100)
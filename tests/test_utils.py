@@ -1,6 +1,8 @@
 from syntdatafft import (
     generate_anomalies,
     create_plot_dict,
+    create_filter_dict,
+    create_filter_kwargs,
     are_all_floats,
     change_type_to_float,
 )
@@ -92,3 +94,81 @@ def test_are_all_floats():
     # Test case with mixed types
     mixed_values = {"a": "apple", "b": 2.5, "c": 3}
     assert are_all_floats(mixed_values) is False
+
+
+def test_create_filter_dict():
+    values = {
+        "duration": "200",
+        "filter_method": "FIR",
+        "filter_type": "bandpass",
+        "filter_low_cutoff": "2",
+        "filter_high_cutoff": "8",
+        "filter_numtaps": "101",
+        "filter_order": "4",
+        "input_1_1": "2.5",
+    }
+
+    filter_settings, filter_params = create_filter_dict(values)
+
+    assert filter_settings == {"method": "FIR", "btype": "bandpass"}
+    assert filter_params == {
+        "low_cutoff": "2",
+        "high_cutoff": "8",
+        "numtaps": "101",
+        "order": "4",
+    }
+
+    # Filter keys are removed, so the remaining values keep their original order
+    assert list(values.keys()) == ["duration", "input_1_1"]
+
+
+@pytest.mark.parametrize(
+    "filter_settings, expected_result",
+    [
+        (
+            {"method": "FIR", "btype": "lowpass"},
+            {"cutoff": 8.0, "btype": "lowpass", "method": "fir", "numtaps": 101},
+        ),
+        (
+            {"method": "IIR", "btype": "highpass"},
+            {"cutoff": 2.0, "btype": "highpass", "method": "iir", "order": 4},
+        ),
+        (
+            {"method": "IIR", "btype": "bandpass"},
+            {"cutoff": (2.0, 8.0), "btype": "bandpass", "method": "iir", "order": 4},
+        ),
+    ],
+)
+def test_create_filter_kwargs(filter_settings, expected_result):
+    filter_params = {"low_cutoff": "2", "high_cutoff": "8,0", "numtaps": "101", "order": "4"}
+
+    result = create_filter_kwargs(filter_settings, filter_params)
+
+    assert result == expected_result
+
+
+def test_create_filter_kwargs_unused_params():
+    # Parameters that the selected filter does not use are not checked
+    filter_settings = {"method": "FIR", "btype": "lowpass"}
+    filter_params = {"low_cutoff": "", "high_cutoff": "8", "numtaps": "101", "order": "abc"}
+
+    result = create_filter_kwargs(filter_settings, filter_params)
+
+    assert result == {"cutoff": 8.0, "btype": "lowpass", "method": "fir", "numtaps": 101}
+
+
+@pytest.mark.parametrize(
+    "filter_params",
+    [
+        {"low_cutoff": "2", "high_cutoff": "8", "numtaps": "inf", "order": "4"},
+        {"low_cutoff": "2", "high_cutoff": "8", "numtaps": "nan", "order": "4"},
+        {"low_cutoff": "2", "high_cutoff": "8", "numtaps": "101.7", "order": "4"},
+        {"low_cutoff": "2", "high_cutoff": "8", "numtaps": "", "order": "4"},
+        {"low_cutoff": "2", "high_cutoff": "inf", "numtaps": "101", "order": "4"},
+    ],
+)
+def test_create_filter_kwargs_invalid(filter_params):
+    filter_settings = {"method": "FIR", "btype": "lowpass"}
+
+    with pytest.raises(ValueError):
+        create_filter_kwargs(filter_settings, filter_params)